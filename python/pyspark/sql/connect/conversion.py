@@ -53,6 +53,7 @@ from typing import (
     Callable,
     Sequence,
     List,
+    Optional,
 )
 
 
@@ -331,38 +332,73 @@ class LocalDataToArrowConversion:
 
         column_names = schema.fieldNames()
 
-        column_convs = [
+        # Values of the columns which do not need a converter, e.g., integral and
+        # floating point columns, are passed to Arrow as they are, instead of going
+        # through an identity converter for every single value.
+        column_convs: List[Optional[Callable]] = [
             LocalDataToArrowConversion._create_converter(
                 field.dataType,
                 field.nullable,
             )
+            if LocalDataToArrowConversion._need_converter(field.dataType, field.nullable)
+            else None
             for field in schema.fields
         ]
 
-        pylist: List[List] = [[] for _ in range(len(column_names))]
+        pylist: Optional[List[List]] = None
 
-        for item in data:
-            if (
-                not isinstance(item, Row)
-                and not isinstance(item, tuple)  # inherited namedtuple
-                and hasattr(item, "__dict__")
+        try:
+            if all(
+                (isinstance(item, tuple) or type(item) is list) and len(item) == len(column_names)
+                for item in data
             ):
-                item = item.__dict__
-            if isinstance(item, dict):
-                for i, col in enumerate(column_names):
-                    pylist[i].append(column_convs[i](item.get(col)))
-            else:
-                if len(item) != len(column_names):
-                    raise PySparkValueError(
-                        error_class="AXIS_LENGTH_MISMATCH",
-                        message_parameters={
-                            "expected_length": str(len(column_names)),
-                            "actual_length": str(len(item)),
-                        },
-                    )
-
-                for i in range(len(column_names)):
-                    pylist[i].append(column_convs[i](item[i]))
+                # Tuples (including Rows and namedtuples) or lists of the expected length,
+                # whose values are taken by position: transpose the rows into columns at
+                # once, and convert the values column by column.
+                pylist = [
+                    list(column) if conv is None else [conv(value) for value in column]
+                    for column, conv in zip(zip(*data), column_convs)
+                ]
+            elif all(isinstance(item, dict) for item in data):
+                # Dictionaries: look up the values of each column at once.
+                pylist = [
+                    [item.get(col) for item in data]
+                    if conv is None
+                    else [conv(item.get(col)) for item in data]
+                    for col, conv in zip(column_names, column_convs)
+                ]
+        except PySparkValueError:
+            # Fall back to the row by row conversion below, so that the error is reported
+            # for the first invalid row, same as before.
+            pylist = None
+
+        if pylist is None:
+            pylist = [[] for _ in range(len(column_names))]
+            for item in data:
+                if (
+                    not isinstance(item, Row)
+                    and not isinstance(item, tuple)  # inherited namedtuple
+                    and hasattr(item, "__dict__")
+                ):
+                    item = item.__dict__
+                if isinstance(item, dict):
+                    for i, col in enumerate(column_names):
+                        conv = column_convs[i]
+                        value = item.get(col)
+                        pylist[i].append(value if conv is None else conv(value))
+                else:
+                    if len(item) != len(column_names):
+                        raise PySparkValueError(
+                            error_class="AXIS_LENGTH_MISMATCH",
+                            message_parameters={
+                                "expected_length": str(len(column_names)),
+                                "actual_length": str(len(item)),
+                            },
+                        )
+
+                    for i in range(len(column_names)):
+                        conv = column_convs[i]
+                        pylist[i].append(item[i] if conv is None else conv(item[i]))
 
         pa_schema = to_arrow_schema(
             StructType(
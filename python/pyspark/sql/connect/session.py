@@ -22,7 +22,7 @@ import threading
 import os
 import warnings
 from collections.abc import Sized
-from functools import reduce
+from functools import cached_property
 from threading import RLock
 from typing import (
     Optional,
@@ -50,9 +50,10 @@ import urllib
 
 from pyspark.sql.connect.dataframe import DataFrame
 from pyspark.sql.dataframe import DataFrame as ParentDataFrame
-from pyspark.loose_version import LooseVersion
+from pyspark.sql.connect.catalog import Catalog
 from pyspark.sql.connect.client import SparkConnectClient, DefaultChannelBuilder
 from pyspark.sql.connect.conf import RuntimeConf
+from pyspark.sql.connect.conversion import LocalDataToArrowConversion
 from pyspark.sql.connect.plan import (
     SQL,
     Range,
@@ -68,6 +69,7 @@ from pyspark.sql.connect.profiler import ProfilerCollector
 from pyspark.sql.connect.readwriter import DataFrameReader
 from pyspark.sql.connect.streaming.readwriter import DataStreamReader
 from pyspark.sql.connect.streaming.query import StreamingQueryManager
+from pyspark.sql.connect.udf import UDFRegistration
 from pyspark.sql.pandas.serializers import ArrowStreamPandasSerializer
 from pyspark.sql.pandas.types import (
     to_arrow_schema,
@@ -79,11 +81,14 @@ from pyspark.sql.profiler import Profile
 from pyspark.sql.session import classproperty, SparkSession as PySparkSession
 from pyspark.sql.types import (
     _infer_schema,
+    _infer_type,
     _has_nulltype,
     _merge_type,
+    _type_mappings,
     Row,
     DataType,
     DayTimeIntervalType,
+    StructField,
     StructType,
     AtomicType,
     TimestampType,
@@ -102,8 +107,6 @@ from pyspark.errors import (
 
 if TYPE_CHECKING:
     from pyspark.sql.connect._typing import OptionalPrimitiveType
-    from pyspark.sql.connect.catalog import Catalog
-    from pyspark.sql.connect.udf import UDFRegistration
     from pyspark.sql.connect.udtf import UDTFRegistration
     from pyspark.sql.connect.shell.progress import ProgressHandler
     from pyspark.sql.connect.datasource import DataSourceRegistration
@@ -116,6 +119,109 @@ except Exception:
     has_memory_profiler = False
 
 
+# Python types whose inferred Spark type only depends on the type, not on the value.
+_PRIMITIVE_TYPES = {bool, int, float, str}
+# Same as above, but also includes None which is inferred as NullType.
+_VALUE_INDEPENDENT_TYPES = _PRIMITIVE_TYPES | {type(None)}
+
+
+def _row_signature(row: Any) -> Optional[Tuple]:
+    """
+    Returns the signature of the row, which is the row type, the field names and the
+    value types. Rows with the same signature have the same inferred schema. Returns
+    None when the inferred schema might depend on the values themselves.
+    """
+    if isinstance(row, dict):
+        names: Optional[Tuple] = tuple(row.keys())
+        values: Iterable[Any] = row.values()
+    elif isinstance(row, (tuple, list)):
+        if hasattr(row, "__fields__"):  # Row
+            names = tuple(row.__fields__)
+        elif hasattr(row, "_fields"):  # namedtuple
+            names = tuple(row._fields)
+        else:
+            names = None
+        values = row
+    else:
+        return None
+
+    types = tuple(map(type, values))
+    if not _VALUE_INDEPENDENT_TYPES.issuperset(types):
+        return None
+    return (type(row), names, types)
+
+
+def _infer_schema_from_primitive_dicts(data: Iterable[Any]) -> Optional[StructType]:
+    """
+    Infer the schema without the row-by-row inference and merge, when all rows are
+    dicts with the same keys and each key always holds a value of the same primitive
+    type. Returns None otherwise, so the caller falls back to the regular inference.
+    """
+    keys = None
+    value_types: Dict[Any, type] = {}
+    for row in data:
+        if not isinstance(row, dict):
+            return None
+        if keys is None:
+            keys = row.keys()
+            value_types = {k: type(v) for k, v in row.items()}
+            if any(t not in _PRIMITIVE_TYPES for t in value_types.values()):
+                return None
+        elif row.keys() != keys:
+            return None
+        for k, v in row.items():
+            if type(v) is not value_types[k]:
+                return None
+
+    if keys is None:
+        return None
+    # Same as `_infer_schema`, the fields of a dict are sorted by the keys.
+    return StructType(
+        [StructField(k, _type_mappings[value_types[k]](), True) for k in sorted(keys)]
+    )
+
+
+def _infer_type_from_column(
+    column: Iterable[Any],
+    name: str,
+    infer_dict_as_struct: bool,
+    infer_array_from_first_element: bool,
+    prefer_timestamp_ntz: bool,
+) -> DataType:
+    """
+    Infer the type of a field from all its values, in the same way as inferring the
+    schema of every row with `_infer_schema` and merging them with `_merge_type`.
+    """
+    dataType: Optional[DataType] = None
+    # Merging a type into the result again does not change it, so values of types
+    # which are inferred regardless of the value are only inferred once per type.
+    seen_types: Set[type] = set()
+    for value in column:
+        value_type = type(value)
+        if value_type in seen_types:
+            continue
+        if value_type in _VALUE_INDEPENDENT_TYPES:
+            seen_types.add(value_type)
+        try:
+            valueType = _infer_type(
+                value,
+                infer_dict_as_struct,
+                infer_array_from_first_element,
+                prefer_timestamp_ntz,
+            )
+        except TypeError:
+            raise PySparkTypeError(
+                error_class="CANNOT_INFER_TYPE_FOR_FIELD",
+                message_parameters={"field_name": name},
+            )
+        if dataType is None:
+            dataType = valueType
+        else:
+            dataType = _merge_type(dataType, valueType, name="field %s" % name)
+    assert dataType is not None
+    return dataType
+
+
 class SparkSession:
     # The active SparkSession for the current thread
     _active_session: ClassVar[threading.local] = threading.local()
@@ -126,8 +232,6 @@ class SparkSession:
     class Builder:
         """Builder for :class:`SparkSession`."""
 
-        _lock = RLock()
-
         def __init__(self) -> None:
             self._options: Dict[str, Any] = {}
             self._channel_builder: Optional[DefaultChannelBuilder] = None
@@ -147,13 +251,12 @@ class SparkSession:
             *,
             map: Optional[Dict[str, "OptionalPrimitiveType"]] = None,
         ) -> "SparkSession.Builder":
-            with self._lock:
-                if map is not None:
-                    for k, v in map.items():
-                        self._options[k] = to_str(v)
-                else:
-                    self._options[cast(str, key)] = to_str(value)
-                return self
+            # Dict updates are atomic, so no lock is needed to guard the options.
+            if map is not None:
+                self._options.update({k: to_str(v) for k, v in map.items()})
+            else:
+                self._options[cast(str, key)] = to_str(value)
+            return self
 
         def master(self, master: str) -> "SparkSession.Builder":
             return self
@@ -186,11 +289,10 @@ class SparkSession:
             -------
             :class:`SparkSession.Builder`
             """
-            with self._lock:
-                # self._channel_builder is a separate field, because it may hold the state
-                # and cannot be serialized with to_str()
-                self._channel_builder = channelBuilder
-                return self
+            # self._channel_builder is a separate field, because it may hold the state
+            # and cannot be serialized with to_str()
+            self._channel_builder = channelBuilder
+            return self
 
         def enableHiveSupport(self) -> "SparkSession.Builder":
             raise PySparkNotImplementedError(
@@ -198,18 +300,19 @@ class SparkSession:
             )
 
         def _apply_options(self, session: "SparkSession") -> None:
-            with self._lock:
-                for k, v in self._options.items():
-                    # the options are applied after session creation,
-                    # so following options always take no effect
-                    if k not in [
-                        "spark.remote",
-                        "spark.master",
-                    ]:
-                        try:
-                            session.conf.set(k, v)
-                        except Exception as e:
-                            warnings.warn(str(e))
+            # Iterate over a snapshot so concurrent config() calls cannot
+            # change the dict size during iteration.
+            for k, v in list(self._options.items()):
+                # the options are applied after session creation,
+                # so following options always take no effect
+                if k not in [
+                    "spark.remote",
+                    "spark.master",
+                ]:
+                    try:
+                        session.conf.set(k, v)
+                    except Exception as e:
+                        warnings.warn(str(e))
 
         def create(self) -> "SparkSession":
             has_channel_builder = self._channel_builder is not None
@@ -273,6 +376,10 @@ class SparkSession:
         # Set to false to prevent client.release_session on close() (testing only)
         self.release_session_on_close = True
 
+        # Serializer reused by createDataFrame with pandas DataFrames,
+        # see also `_get_pandas_serializer`.
+        self._pandas_serializer: Optional[ArrowStreamPandasSerializer] = None
+
     @classmethod
     def _set_default_and_active_session(cls, session: "SparkSession") -> None:
         """
@@ -384,19 +491,103 @@ class SparkSession:
             "spark.sql.pyspark.legacy.inferArrayTypeFromFirstElement.enabled",
             "spark.sql.timestampType",
         )
-        return reduce(
-            _merge_type,
-            (
-                _infer_schema(
-                    row,
-                    names,
-                    infer_dict_as_struct=(infer_dict_as_struct == "true"),
-                    infer_array_from_first_element=(infer_array_from_first_element == "true"),
-                    prefer_timestamp_ntz=(prefer_timestamp_ntz == "TIMESTAMP_NTZ"),
-                )
-                for row in data
-            ),
-        )
+
+        schema = _infer_schema_from_primitive_dicts(data)
+        if schema is not None:
+            return schema
+
+        _infer_dict_as_struct = infer_dict_as_struct == "true"
+        _infer_array_from_first_element = infer_array_from_first_element == "true"
+        _prefer_timestamp_ntz = prefer_timestamp_ntz == "TIMESTAMP_NTZ"
+
+        rows = cast(List[Any], data)
+        num_fields = len(rows[0]) if type(rows[0]) in (tuple, list) else -1
+        if num_fields >= 0 and all(
+            type(row) in (tuple, list) and len(row) == num_fields for row in rows
+        ):
+            # Plain tuples or lists of the same length: transpose the rows into columns
+            # at once, and infer the type of each field from its column.
+            if names is None:
+                names = ["_%d" % i for i in range(1, num_fields + 1)]
+            elif len(names) < num_fields:
+                names.extend("_%d" % i for i in range(len(names) + 1, num_fields + 1))
+            column_field_names = names[:num_fields]
+
+            if len(set(column_field_names)) == num_fields:
+                try:
+                    return StructType(
+                        [
+                            StructField(
+                                name,
+                                _infer_type_from_column(
+                                    column,
+                                    name,
+                                    _infer_dict_as_struct,
+                                    _infer_array_from_first_element,
+                                    _prefer_timestamp_ntz,
+                                ),
+                                True,
+                            )
+                            for name, column in zip(column_field_names, zip(*rows))
+                        ]
+                    )
+                except PySparkTypeError:
+                    # Fall back to the row by row inference below, so that the error
+                    # is reported for the first invalid row, same as before.
+                    pass
+
+        # Merge the field types in place, and only build the StructType once at the end,
+        # instead of creating an intermediate StructType for every row.
+        field_names: Optional[List[str]] = None
+        field_types: List[DataType] = []
+        has_unique_names = False
+        # Rows with a signature already merged are skipped, since they have the same schema,
+        # and merging it again does not change the result as long as the field names are
+        # unique. With duplicated names, `_merge_type` merges every field of a name with the
+        # type of the last field of that name, so the rows are always merged.
+        seen_signatures: Set[Tuple] = set()
+        for row in data:
+            signature = _row_signature(row)
+            if signature is not None:
+                if has_unique_names and signature in seen_signatures:
+                    continue
+                seen_signatures.add(signature)
+            row_schema = _infer_schema(
+                row,
+                names,
+                infer_dict_as_struct=_infer_dict_as_struct,
+                infer_array_from_first_element=_infer_array_from_first_element,
+                prefer_timestamp_ntz=_prefer_timestamp_ntz,
+            )
+            if field_names is not None and has_unique_names and row_schema.names == field_names:
+                for i, field in enumerate(row_schema.fields):
+                    field_types[i] = _merge_type(
+                        field_types[i], field.dataType, name="field %s" % field.name
+                    )
+            else:
+                if field_names is not None:
+                    # Different or duplicated field names, merge the whole struct.
+                    row_schema = _merge_type(
+                        StructType([StructField(n, t) for n, t in zip(field_names, field_types)]),
+                        row_schema,
+                    )
+                field_names = row_schema.names
+                field_types = [field.dataType for field in row_schema.fields]
+                has_unique_names = len(set(field_names)) == len(field_names)
+
+        assert field_names is not None
+        return StructType([StructField(n, t) for n, t in zip(field_names, field_types)])
+
+    def _get_pandas_serializer(self, timezone: str, safecheck: bool) -> ArrowStreamPandasSerializer:
+        """
+        Returns the serializer to convert pandas DataFrames to Arrow, which is only created
+        again when the session time zone or the safe check configuration changes.
+        """
+        ser = self._pandas_serializer
+        if ser is None or ser._timezone != timezone or ser._safecheck != safecheck:
+            ser = ArrowStreamPandasSerializer(timezone, safecheck)
+            self._pandas_serializer = ser
+        return ser
 
     def createDataFrame(
         self,
@@ -448,6 +639,11 @@ class SparkSession:
                 },
             )
 
+        if not isinstance(data, Sized):
+            # Other iterables, e.g., generators, are materialized here once, so that empty
+            # ones are handled in the same way as empty lists below.
+            data = list(data)
+
         if isinstance(data, np.ndarray) and data.ndim not in [1, 2]:
             raise PySparkValueError(
                 error_class="INVALID_NDARRAY_DIMENSION",
@@ -514,33 +710,52 @@ class SparkSession:
                     message_parameters={"data_type": str(schema)},
                 )
             else:
-                # Any timestamps must be coerced to be compatible with Spark
-                spark_types = [
-                    TimestampType()
+                # Any timestamps must be coerced to be compatible with Spark.
+                # Wide DataFrames usually have only a few distinct dtypes, so the types
+                # are determined once per distinct dtype rather than once per column.
+                dtype_spark_types: Dict[Any, Optional[DataType]] = {
+                    t: TimestampType()
                     if is_datetime64_dtype(t) or isinstance(t, pd.DatetimeTZDtype)
                     else DayTimeIntervalType()
                     if is_timedelta64_dtype(t)
                     else None
-                    for t in data.dtypes
-                ]
-                arrow_types = [to_arrow_type(dt) if dt is not None else None for dt in spark_types]
+                    for t in set(data.dtypes)
+                }
+                dtype_arrow_types = {
+                    t: to_arrow_type(dt) if dt is not None else None
+                    for t, dt in dtype_spark_types.items()
+                }
+                spark_types = [dtype_spark_types[t] for t in data.dtypes]
+                arrow_types = [dtype_arrow_types[t] for t in data.dtypes]
 
             timezone, safecheck = self._client.get_configs(
                 "spark.sql.session.timeZone", "spark.sql.execution.pandas.convertToArrowArraySafely"
             )
 
-            ser = ArrowStreamPandasSerializer(cast(str, timezone), safecheck == "true")
-
-            _table = pa.Table.from_batches(
-                [
-                    ser._create_batch(
-                        [
-                            (c, at, st)
-                            for (_, c), at, st in zip(data.items(), arrow_types, spark_types)
-                        ]
-                    )
-                ]
-            )
+            if (
+                not isinstance(schema, StructType)
+                and data.columns.is_unique
+                and all(isinstance(t, np.dtype) and t.kind in "biuf" for t in data.dtypes)
+            ):
+                # All the columns are backed by numeric NumPy arrays which do not need any
+                # coercion, so let Arrow convert the whole DataFrame at once instead of
+                # creating the arrays column by column in the serializer.
+                _table = pa.Table.from_pandas(
+                    data, preserve_index=False, safe=(safecheck == "true")
+                ).replace_schema_metadata()
+            else:
+                ser = self._get_pandas_serializer(cast(str, timezone), safecheck == "true")
+
+                _table = pa.Table.from_batches(
+                    [
+                        ser._create_batch(
+                            [
+                                (c, at, st)
+                                for (_, c), at, st in zip(data.items(), arrow_types, spark_types)
+                            ]
+                        )
+                    ]
+                )
 
             if isinstance(schema, StructType):
                 assert arrow_schema is not None
@@ -555,43 +770,46 @@ class SparkSession:
                 else:
                     _cols = ["_%s" % i for i in range(1, data.shape[1] + 1)]
 
-            if data.ndim == 1:
-                if 1 != len(_cols):
-                    raise PySparkValueError(
-                        error_class="AXIS_LENGTH_MISMATCH",
-                        message_parameters={
-                            "expected_length": str(len(_cols)),
-                            "actual_length": "1",
-                        },
-                    )
+            # Validate the number of columns before converting any data.
+            num_columns = 1 if data.ndim == 1 else data.shape[1]
+            if num_columns != len(_cols):
+                raise PySparkValueError(
+                    error_class="AXIS_LENGTH_MISMATCH",
+                    message_parameters={
+                        "expected_length": str(len(_cols)),
+                        "actual_length": str(num_columns),
+                    },
+                )
 
-                _table = pa.Table.from_arrays([pa.array(data)], _cols)
-            else:
-                if data.shape[1] != len(_cols):
-                    raise PySparkValueError(
-                        error_class="AXIS_LENGTH_MISMATCH",
-                        message_parameters={
-                            "expected_length": str(len(_cols)),
-                            "actual_length": str(data.shape[1]),
-                        },
-                    )
+            # The Arrow type of numeric arrays directly follows from the dtype,
+            # so pass it to skip the type inference.
+            arrow_type = pa.from_numpy_dtype(data.dtype) if data.dtype.kind in "biuf" else None
 
+            if data.ndim == 1:
+                _table = pa.Table.from_arrays([pa.array(data, type=arrow_type)], _cols)
+            else:
+                # Convert to column-major order once, so that each column is a
+                # contiguous buffer that Arrow can wrap without a strided gather.
+                _columns = np.asfortranarray(data)
                 _table = pa.Table.from_arrays(
-                    [pa.array(data[::, i]) for i in range(0, data.shape[1])], _cols
+                    [
+                        pa.array(_columns[:, i], type=arrow_type)
+                        for i in range(0, _columns.shape[1])
+                    ],
+                    _cols,
                 )
 
             # The _table should already have the proper column names.
             _cols = None
 
         else:
-            _data = list(data)
+            # Lists are used as they are, only other collections are copied into a list,
+            # since the schema inference and the conversion go through the rows several times.
+            _data = data if isinstance(data, list) else list(cast(Iterable[Any], data))
 
-            if isinstance(_data[0], dict):
-                # Sort the data to respect inferred schema.
-                # For dictionaries, we sort the schema in alphabetical order.
-                _data = [dict(sorted(d.items())) if d is not None else None for d in _data]
-
-            elif not isinstance(_data[0], (Row, tuple, list, dict)) and not hasattr(
+            # Dictionaries are not sorted here: the inferred schema sorts the fields in
+            # alphabetical order, and the values are looked up by the field names.
+            if not isinstance(_data[0], (Row, tuple, list, dict)) and not hasattr(
                 _data[0], "__dict__"
             ):
                 # input data can be [1, 2, 3]
@@ -614,8 +832,6 @@ class SparkSession:
                         error_class="CANNOT_DETERMINE_TYPE", message_parameters={}
                     )
 
-            from pyspark.sql.connect.conversion import LocalDataToArrowConversion
-
             # Spark Connect will try its best to build the Arrow table with the
             # inferred schema in the client side, and then rename the columns and
             # cast the datatypes in the server side.
@@ -623,12 +839,12 @@ class SparkSession:
 
         # TODO: Beside the validation on number of columns, we should also check
         # whether the Arrow Schema is compatible with the user provided Schema.
-        if _num_cols is not None and _num_cols != _table.shape[1]:
+        if _num_cols is not None and _num_cols != _table.num_columns:
             raise PySparkValueError(
                 error_class="AXIS_LENGTH_MISMATCH",
                 message_parameters={
                     "expected_length": str(_num_cols),
-                    "actual_length": str(_table.shape[1]),
+                    "actual_length": str(_table.num_columns),
                 },
             )
 
@@ -714,13 +930,9 @@ class SparkSession:
 
     range.__doc__ = PySparkSession.range.__doc__
 
-    @property
+    @cached_property
     def catalog(self) -> "Catalog":
-        from pyspark.sql.connect.catalog import Catalog
-
-        if not hasattr(self, "_catalog"):
-            self._catalog = Catalog(self)
-        return self._catalog
+        return Catalog(self)
 
     catalog.__doc__ = PySparkSession.catalog.__doc__
 
@@ -796,10 +1008,9 @@ class SparkSession:
                 # client with a different remote address.
                 if PySparkSession._activeSession is not None:
                     PySparkSession._activeSession.stop()
-                del os.environ["SPARK_LOCAL_REMOTE"]
-                del os.environ["SPARK_CONNECT_MODE_ENABLED"]
-                if "SPARK_REMOTE" in os.environ:
-                    del os.environ["SPARK_REMOTE"]
+                os.environ.pop("SPARK_LOCAL_REMOTE", None)
+                os.environ.pop("SPARK_CONNECT_MODE_ENABLED", None)
+                os.environ.pop("SPARK_REMOTE", None)
 
     stop.__doc__ = PySparkSession.stop.__doc__
 
@@ -816,12 +1027,9 @@ class SparkSession:
 
     conf.__doc__ = PySparkSession.conf.__doc__
 
-    @property
+    @cached_property
     def streams(self) -> "StreamingQueryManager":
-        if hasattr(self, "_sqm"):
-            return self._sqm
-        self._sqm: StreamingQueryManager = StreamingQueryManager(self)
-        return self._sqm
+        return StreamingQueryManager(self)
 
     streams.__doc__ = PySparkSession.streams.__doc__
 
@@ -834,8 +1042,6 @@ class SparkSession:
 
     @property
     def udf(self) -> "UDFRegistration":
-        from pyspark.sql.connect.udf import UDFRegistration
-
         return UDFRegistration(self)
 
     udf.__doc__ = PySparkSession.udf.__doc__
@@ -977,16 +1183,14 @@ class SparkSession:
 
             # Check if we're using unreleased version that is in development.
             # Also checks SPARK_TESTING for RC versions.
-            is_dev_mode = (
-                "dev" in LooseVersion(__version__).version or "SPARK_TESTING" in os.environ
-            )
+            is_dev_mode = "dev" in __version__ or "SPARK_TESTING" in os.environ
 
             origin_remote = os.environ.get("SPARK_REMOTE", None)
             try:
                 if origin_remote is not None:
                     # So SparkSubmit thinks no remote is set in order to
                     # start the regular PySpark session.
-                    del os.environ["SPARK_REMOTE"]
+                    os.environ.pop("SPARK_REMOTE", None)
 
                 SparkContext._ensure_initialized(conf=create_conf(loadDefaults=False))
 
@@ -333,15 +333,19 @@ class SparkConnectCreationTests(SparkConnectSQLTestCase):
 
             self.assert_eq(cdf.toPandas(), sdf.toPandas())
 
-        # check error
-        with self.assertRaises(PySparkValueError) as pe:
-            self.connect.createDataFrame(data=[])
+            cdf = self.connect.createDataFrame(data=iter([]), schema=schema)
+            self.assert_eq(cdf.toPandas(), sdf.toPandas())
 
-        self.check_error(
-            exception=pe.exception,
-            error_class="CANNOT_INFER_EMPTY_SCHEMA",
-            message_parameters={},
-        )
+        # check error
+        for data in [[], iter([])]:
+            with self.assertRaises(PySparkValueError) as pe:
+                self.connect.createDataFrame(data=data)
+
+            self.check_error(
+                exception=pe.exception,
+                error_class="CANNOT_INFER_EMPTY_SCHEMA",
+                message_parameters={},
+            )
 
     def test_create_dataframe_from_arrays(self):
         # SPARK-42021: createDataFrame support array.array
@@ -690,6 +694,72 @@ class SparkConnectCreationTests(SparkConnectSQLTestCase):
         rows = [cols] * row_count
         self.assertEqual(row_count, self.connect.createDataFrame(data=rows).count())
 
+    def test_create_dataframe_from_dicts(self):
+        for data in [
+            [{"b": 1, "a": "x", "c": True}, {"b": 2, "a": "y", "c": False}],
+            [{"a": 1}, {"a": 2, "b": "y"}],
+            [{"a": 1, "b": None}, {"a": 2, "b": "y"}],
+        ]:
+            sdf = self.spark.createDataFrame(data)
+            cdf = self.connect.createDataFrame(data)
+
+            self.assertEqual(sdf.schema, cdf.schema)
+            self.assertEqual(sdf.collect(), cdf.collect())
+
+    def test_create_dataframe_from_tuples(self):
+        for data in [
+            [(1, "a", 1.5), (2, None, 2.5), (3, "c", None)],
+            [[1, "a", 1.5], [2, None, 2.5], [3, "c", None]],
+        ]:
+            for schema in [None, ["x"], ["x", "y"], ["x", "y", "z"]]:
+                sdf = self.spark.createDataFrame(data, schema=schema)
+                cdf = self.connect.createDataFrame(data, schema=schema)
+
+                self.assertEqual(sdf.schema, cdf.schema)
+                self.assertEqual(sdf.collect(), cdf.collect())
+
+        # The error is reported for the first invalid row.
+        schema = StructType(
+            [StructField("a", LongType(), False), StructField("b", StringType(), False)]
+        )
+        for data in [
+            [(1, None), (None, "b")],
+            [{"a": 1, "b": None}, {"a": None, "b": "b"}],
+        ]:
+            with self.assertRaises(PySparkValueError) as pe:
+                self.connect.createDataFrame(data, schema=schema)
+
+            self.assertIn("input for StringType() must not be None", str(pe.exception))
+
+    def test_create_dataframe_with_duplicated_names(self):
+        for data, schema in [
+            ([(1, "a"), (2, "b")], ["a", "a"]),
+            ([(1, "a"), (2, "b"), (3, "c")], ["a", "a"]),
+            ([Row("a", "a")(1, "x"), Row("a", "a")(2, "y")], None),
+        ]:
+            sdf = self.spark.createDataFrame(data, schema=schema)
+            cdf = self.connect.createDataFrame(data, schema=schema)
+
+            self.assertEqual(sdf.schema, cdf.schema)
+            self.assertEqual(sdf.collect(), cdf.collect())
+
+    def test_create_dataframe_from_numeric_pandas(self):
+        pdf = pd.DataFrame(
+            {
+                "a": [1, 2, 3],
+                "b": [1.5, 2.5, 3.5],
+                "c": [True, False, True],
+                "d": np.array([1, 2, 3], dtype=np.int32),
+            }
+        )
+
+        for schema in [None, ["w", "x", "y", "z"]]:
+            sdf = self.spark.createDataFrame(pdf, schema=schema)
+            cdf = self.connect.createDataFrame(pdf, schema=schema)
+
+            self.assertEqual(sdf.schema, cdf.schema)
+            self.assert_eq(sdf.toPandas(), cdf.toPandas())
+
     def test_simple_udt(self):
         from pyspark.ml.linalg import MatrixUDT, VectorUDT
 